@@ -4,12 +4,18 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 from agentflow_cli.cli.constants import CONFIG_FILENAMES, PROJECT_ROOT
 from agentflow_cli.cli.exceptions import ConfigurationError
 
 
+NO_CONFIG_FOUND_MESSAGE: Final[str] = (
+    "No configuration file found. Please provide a config file path "
+    "or create one of: " + ", ".join(CONFIG_FILENAMES)
+)
+
+
 class ConfigManager:
     """Manages configuration discovery and validation."""
 
@@ -115,14 +121,11 @@ class ConfigManager:
         else:
             discovered_path = self.auto_discover_config()
             if not discovered_path:
-                raise ConfigurationError(
-                    "No configuration file found. Please provide a config file path "
-                    "or create one of: " + ", ".join(CONFIG_FILENAMES)
-                )
+                raise ConfigurationError(NO_CONFIG_FOUND_MESSAGE)
             actual_path = discovered_path
 
         try:
-            with actual_path.open("r", encoding="utf-8") as f:
+            with actual_path.open("r", encoding="utf-8-sig") as f:
                 self._config_data = json.load(f)
         except json.JSONDecodeError as e:
             raise ConfigurationError(
@@ -7,6 +7,12 @@ from typing import Any
 from agentflow_cli.cli.exceptions import ValidationError
 
 
+# Semantic versioning (major.minor or major.minor.patch)
+_PYTHON_VERSION_RE = re.compile(r"^(\d+)\.(\d+)(?:\.(\d+))?$")
+# Docker service names
+_SERVICE_NAME_RE = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_.-]*$")
+
+
 class Validator:
     """Input validation utilities."""
 
@@ -47,14 +53,15 @@ class Validator:
         if not isinstance(host, str):
             raise ValidationError("Host must be a string", field="host")
 
-        if not host.strip():
+        host = host.strip()
+        if not host:
             raise ValidationError("Host cannot be empty", field="host")
 
         # Basic validation - could be enhanced with more sophisticated checks
         if len(host) > 255:  # noqa: PLR2004
             raise ValidationError("Host address too long", field="host")
 
-        return host.strip()
+        return host
 
     @staticmethod
     def validate_path(path: str | Path, must_exist: bool = False) -> Path:
@@ -96,10 +103,7 @@ class Validator:
         if not isinstance(version, str):
             raise ValidationError("Python version must be a string", field="python_version")
 
-        # Pattern for semantic versioning (major.minor or major.minor.patch)
-        version_pattern = r"^(\d+)\.(\d+)(?:\.(\d+))?$"
-
-        if not re.match(version_pattern, version):
+        if not _PYTHON_VERSION_RE.match(version):
             raise ValidationError(
                 "Python version must be in format 'X.Y' or 'X.Y.Z'", field="python_version"
             )
@@ -135,7 +139,7 @@ class Validator:
             raise ValidationError("Service name cannot be empty", field="service_name")
 
         # Docker service name validation
-        if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9_.-]*$", name):
+        if not _SERVICE_NAME_RE.match(name):
             raise ValidationError(
                 "Service name must start with alphanumeric character and "
                 "contain only alphanumeric, underscore, period, or hyphen",
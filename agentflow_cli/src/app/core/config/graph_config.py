@@ -7,7 +7,7 @@ from dotenv import load_dotenv
 
 class GraphConfig:
     def __init__(self, path: str = "agentflow.json"):
-        with Path(path).open() as f:
+        with Path(path).open(encoding="utf-8-sig") as f:
             self.data: dict = json.load(f)
 
         # load .env file
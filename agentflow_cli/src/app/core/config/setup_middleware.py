@@ -51,7 +51,7 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         # Add request ID and timestamp to request headers
         request.state.request_id = request_id
         request.state.timestamp = timestamp
-        logger.debug(f"Requesting: Request ID: {request_id}, Timestamp: {timestamp}")
+        logger.debug("Requesting: Request ID: %s, Timestamp: %s", request_id, timestamp)
 
         # Proceed with the request
         response = await call_next(request)
@@ -59,7 +59,7 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         # Add request ID and timestamp to response headers for logging
         response.headers["X-Request-ID"] = request_id
         response.headers["X-Timestamp"] = timestamp
-        logger.debug(f"Response: Request ID: {request_id}, Timestamp: {timestamp}")
+        logger.debug("Response: Request ID: %s, Timestamp: %s", request_id, timestamp)
 
         return response
 
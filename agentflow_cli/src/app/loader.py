@@ -216,6 +216,7 @@ async def attach_all_modules(
         container.bind_instance(ThreadNameGenerator, None, allow_none=True)
 
     logger.info("Container loaded successfully")
-    logger.debug(f"Container dependency graph: {container.get_dependency_graph()}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Container dependency graph: %s", container.get_dependency_graph())
 
     return graph
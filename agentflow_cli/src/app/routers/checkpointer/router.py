@@ -49,7 +49,7 @@ async def get_state(
     Returns:
         State response with state data or error
     """
-    logger.debug(f"User info: {user}")
+    logger.debug("User info: %s", user)
 
     config = {"thread_id": thread_id}
 
@@ -89,7 +89,7 @@ async def put_state(
     Returns:
         Success response or error
     """
-    logger.debug(f"User info: {user}")
+    logger.debug("User info: %s", user)
     config = {"thread_id": thread_id}
     if payload.config:
         config.update(payload.config)
@@ -131,7 +131,7 @@ async def clear_state(
     Returns:
         Success response or error
     """
-    logger.debug(f"User info: {user}")
+    logger.debug("User info: %s", user)
     config = {"thread_id": thread_id}
 
     res = await service.clear_state(
@@ -173,7 +173,7 @@ async def put_messages(
     Returns:
         Success response or error
     """
-    logger.debug(f"User info: {user}")
+    logger.debug("User info: %s", user)
 
     # Convert message dicts to Message objects if needed
     config = {"thread_id": thread_id}
@@ -220,7 +220,7 @@ async def get_message(
     Returns:
         Message response with message data or error
     """
-    logger.debug(f"User info: {user}")
+    logger.debug("User info: %s", user)
     config = {"thread_id": thread_id}
 
     result = await service.get_message(
@@ -263,7 +263,7 @@ async def list_messages(
     Returns:
         Messages list response with messages data or error
     """
-    logger.debug(f"User info: {user}")
+    logger.debug("User info: %s", user)
     config = {"thread_id": thread_id}
 
     result = await service.get_messages(
@@ -306,7 +306,7 @@ async def delete_message(
     Returns:
         Success response or error
     """
-    logger.debug(f"User info: {user}")
+    logger.debug("User info: %s", user)
     config = {"thread_id": thread_id}
     if payload.config:
         config.update(payload.config)
@@ -350,7 +350,7 @@ async def get_thread(
     Returns:
         Thread response with thread data or error
     """
-    logger.debug(f"User info: {user}")
+    logger.debug("User info: %s", user)
 
     result = await service.get_thread(
         {"thread_id": thread_id},
@@ -389,7 +389,7 @@ async def list_threads(
     Returns:
         Threads list response with threads data or error
     """
-    logger.debug(f"User info: {user}")
+    logger.debug("User info: %s", user)
 
     result = await service.list_threads(
         user,
@@ -429,7 +429,7 @@ async def delete_thread(
     Returns:
         Success response or error
     """
-    logger.debug(f"User info: {user} and thread ID: {thread_id}")
+    logger.debug("User info: %s and thread ID: %s", user, thread_id)
 
     config = {"thread_id": thread_id}
     if payload.config:
@@ -130,7 +130,7 @@ class CheckpointerService:
     # Threads
     async def get_thread(self, config: dict[str, Any], user: dict) -> ThreadResponseSchema:
         cfg = self._config(config, user)
-        logger.debug(f"User info: {user} and thread config: {cfg}")
+        logger.debug("User info: %s and thread config: %s", user, cfg)
         res = await self.checkpointer.aget_thread(cfg)
         return ThreadResponseSchema(thread=res.model_dump() if res else None)
 
@@ -152,7 +152,7 @@ class CheckpointerService:
         thread_id: Any,
     ) -> ResponseSchema:
         cfg = self._config(config, user)
-        logger.debug(f"User info: {user} and thread ID: {thread_id}")
+        logger.debug("User info: %s and thread ID: %s", user, thread_id)
         res = await self.checkpointer.aclean_thread(cfg)
         return ResponseSchema(success=True, message="Thread deleted successfully", data=res)
 
@@ -42,7 +42,7 @@ async def invoke_graph(
     Invoke the graph with the provided input and return the final result.
     """
     logger.info(f"Graph invoke request received with {len(graph_input.messages)} messages")
-    logger.debug(f"User info: {user}")
+    logger.debug("User info: %s", user)
 
     result: GraphInvokeOutputSchema = await service.invoke_graph(
         graph_input,
@@ -167,7 +167,7 @@ async def stop_graph(
         Status information about the stop operation
     """
     logger.info(f"Graph stop request received for thread: {stop_request.thread_id}")
-    logger.debug(f"User info: {user}")
+    logger.debug("User info: %s", user)
 
     result = await service.stop_graph(stop_request.thread_id, user, stop_request.config)
 
@@ -202,7 +202,7 @@ async def setup_graph(
         Status information about the setup operation
     """
     logger.info("Graph setup request received")
-    logger.debug(f"User info: {user}")
+    logger.debug("User info: %s", user)
 
     result = await service.setup(setup_request)
 
@@ -256,7 +256,7 @@ async def fix_graph(
             for the given thread_id
     """
     logger.info(f"Graph fix request received for thread: {fix_request.thread_id}")
-    logger.debug(f"User info: {user}")
+    logger.debug("User info: %s", user)
 
     result = await service.fix_graph(
         fix_request.thread_id,
@@ -51,6 +51,7 @@ class GraphService:
         self.config = config
         self.checkpointer = checkpointer
         self.thread_name_generator = thread_name_generator
+        self._state_schema: dict | None = None
 
     async def _save_thread_name(
         self,
@@ -136,7 +137,7 @@ class GraphService:
         """
         try:
             logger.info(f"Stopping graph execution for thread: {thread_id}")
-            logger.debug(f"User info: {user}")
+            logger.debug("User info: %s", user)
 
             # Prepare config with thread_id and user info
             stop_config = {
@@ -212,7 +213,7 @@ class GraphService:
             HTTPException: If graph execution fails.
         """
         try:
-            logger.debug(f"Invoking graph with input: {graph_input.messages}")
+            logger.debug("Invoking graph with input: %s", graph_input.messages)
 
             # Prepare the input
             input_data, config, meta = await self._prepare_input(graph_input)
@@ -276,7 +277,7 @@ class GraphService:
             HTTPException: If graph streaming fails.
         """
         try:
-            logger.debug(f"Streaming graph with input: {graph_input.messages}")
+            logger.debug("Streaming graph with input: %s", graph_input.messages)
 
             # Prepare the config
             input_data, config, meta = await self._prepare_input(graph_input)
@@ -337,9 +338,11 @@ class GraphService:
     async def get_state_schema(self) -> dict:
         try:
             logger.info("Getting state schema")
-            # Fetch and return state schema
-            res: BaseModel = self._graph._state
-            return res.model_json_schema()
+            # The state type is fixed for the lifetime of the graph, so build it once
+            if self._state_schema is None:
+                res: BaseModel = self._graph._state
+                self._state_schema = res.model_json_schema()
+            return self._state_schema
         except Exception as e:
             logger.error(f"Failed to get state schema: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to get state schema: {e!s}")
@@ -374,7 +377,7 @@ class GraphService:
         """
 
         logger.info(f"Starting fix graph operation for thread: {thread_id}")
-        logger.debug(f"User info: {user}")
+        logger.debug("User info: %s", user)
 
         fix_config = {
             "thread_id": thread_id,
@@ -398,7 +401,7 @@ class GraphService:
             }
 
         messages: list[Message] = state.context
-        logger.debug(f"Found {len(messages)} messages in state")
+        logger.debug("Found %d messages in state", len(messages))
 
         if not messages:
             logger.info("No messages found in state, nothing to fix")
@@ -168,6 +168,8 @@ class AIThreadNameGenerator:
         "weaving": ["ideas", "stories", "connections", "patterns", "narratives"],
         "illuminating": ["concepts", "mysteries", "paths", "truths", "possibilities"],
     }
+    # Precomputed once so secrets.choice doesn't rebuild the key list on every call
+    ACTION_NAMES = tuple(ACTION_PATTERNS)
 
     # Descriptive compound patterns
     COMPOUND_PATTERNS = [
@@ -212,7 +214,7 @@ class AIThreadNameGenerator:
             >>> AIThreadNameGenerator().generate_action_name()
             'building-connections'
         """
-        action = secrets.choice(list(self.ACTION_PATTERNS.keys()))
+        action = secrets.choice(self.ACTION_NAMES)
         target = secrets.choice(self.ACTION_PATTERNS[action])
         return f"{action}{separator}{target}"
 
@@ -287,6 +289,9 @@ class DummyThreadNameGenerator(ThreadNameGenerator):
     Use AIThreadNameGenerator instead.
     """
 
+    # AIThreadNameGenerator holds no per-instance state, so one instance is shared
+    _generator = AIThreadNameGenerator()
+
     async def generate_name(self, messages: list[str]) -> str:
         """Generate a dummy thread name.
 
@@ -300,5 +305,4 @@ class DummyThreadNameGenerator(ThreadNameGenerator):
             >>> DummyThreadNameGenerator().generate_name()
             'thoughtful-dialogue'
         """
-        generator = AIThreadNameGenerator()
-        return generator.generate_name("-")
+        return self._generator.generate_name("-")
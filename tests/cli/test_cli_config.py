@@ -0,0 +1,20 @@
+import json
+from pathlib import Path
+
+from agentflow_cli.cli.core.config import ConfigManager
+
+
+def test_config_manager_loads_config(tmp_path: Path):
+    cfg_path = tmp_path / "agentflow.json"
+    cfg_path.write_text(json.dumps({"agent": "graph.react:app"}), encoding="utf-8")
+
+    data = ConfigManager().load_config(str(cfg_path))
+    assert data["agent"] == "graph.react:app"
+
+
+def test_config_manager_loads_config_with_utf8_bom(tmp_path: Path):
+    cfg_path = tmp_path / "agentflow.json"
+    cfg_path.write_bytes(b"\xef\xbb\xbf" + json.dumps({"agent": "graph.react:app"}).encode("utf-8"))
+
+    data = ConfigManager().load_config(str(cfg_path))
+    assert data["agent"] == "graph.react:app"
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from agentflow.checkpointer import BaseCheckpointer
+from agentflow.exceptions import StorageError
 from agentflow.state import AgentState, Message
 
 from agentflow_cli.src.app.routers.checkpointer.schemas.checkpointer_schemas import (
@@ -106,6 +107,40 @@ class TestCheckpointerService:
         assert result.state == {"cached": "data"}
         mock_checkpointer.aget_state_cache.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_put_state_writes_state_and_cache(self, checkpointer_service, mock_checkpointer):
+        """Test put_state persists the merged state and updates the cache."""
+        mock_checkpointer.aget_state.return_value = AgentState()
+        mock_checkpointer.aput_state.return_value = AgentState()
+
+        with patch(
+            "agentflow_cli.src.app.routers.checkpointer.services.checkpointer_service.parse_state_output"
+        ) as mock_parse:
+            mock_parse.return_value = {"test": "data"}
+
+            result = await checkpointer_service.put_state({}, {"user_id": "123"}, {})
+
+        assert isinstance(result, StateResponseSchema)
+        assert result.state == {"test": "data"}
+        mock_checkpointer.aput_state.assert_called_once()
+        mock_checkpointer.aput_state_cache.assert_called_once()
+        stored = mock_checkpointer.aput_state.call_args.args[1]
+        assert mock_checkpointer.aput_state_cache.call_args.args[1] is stored
+
+    @pytest.mark.asyncio
+    async def test_put_state_skips_cache_when_persist_fails(
+        self, checkpointer_service, mock_checkpointer
+    ):
+        """Test put_state does not cache state that failed to persist."""
+        mock_checkpointer.aget_state.return_value = AgentState()
+        mock_checkpointer.aput_state.side_effect = StorageError("database unavailable")
+
+        with pytest.raises(StorageError):
+            await checkpointer_service.put_state({}, {"user_id": "123"}, {})
+
+        mock_checkpointer.aput_state.assert_called_once()
+        mock_checkpointer.aput_state_cache.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_clear_state_success(self, checkpointer_service, mock_checkpointer):
         """Test clear_state returns success response."""
@@ -28,3 +28,11 @@ def test_graph_config_missing_agent_raises(tmp_path: Path):
 
     with pytest.raises(ValueError):
         _ = GraphConfig(str(cfg_path)).graph_path
+
+
+def test_graph_config_reads_utf8_bom(tmp_path: Path):
+    cfg_path = tmp_path / "cfg.json"
+    cfg_path.write_bytes(b"\xef\xbb\xbf" + json.dumps({"agent": "mod:func"}).encode("utf-8"))
+
+    cfg = GraphConfig(str(cfg_path))
+    assert cfg.graph_path == "mod:func"
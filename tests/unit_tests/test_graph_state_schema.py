@@ -0,0 +1,38 @@
+"""Unit tests for GraphService.get_state_schema."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from agentflow.state import AgentState
+
+from agentflow_cli.src.app.routers.graph.services.graph_service import GraphService
+
+
+@pytest.fixture
+def graph_service():
+    """Create a GraphService instance with a mocked graph."""
+    service = GraphService.__new__(GraphService)  # Skip __init__
+    service._graph = MagicMock()
+    service._graph._state = AgentState()
+    service._state_schema = None
+    return service
+
+
+@pytest.mark.asyncio
+async def test_get_state_schema_returns_state_json_schema(graph_service):
+    result = await graph_service.get_state_schema()
+
+    assert result == AgentState.model_json_schema()
+
+
+@pytest.mark.asyncio
+async def test_get_state_schema_is_built_once(graph_service):
+    state = MagicMock()
+    state.model_json_schema.return_value = {"title": "AgentState"}
+    graph_service._graph._state = state
+
+    first = await graph_service.get_state_schema()
+    second = await graph_service.get_state_schema()
+
+    assert first == second == {"title": "AgentState"}
+    state.model_json_schema.assert_called_once()